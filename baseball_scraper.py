@@ -1,8 +1,23 @@
 ## Baseball Scraper
 ## Consolidated Web Scraping Script for the American League
 
+import argparse
+import asyncio
 import csv
+import functools
+import hashlib
+import multiprocessing
+import multiprocessing.util
 import os
+import random
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import aiohttp
+import diskcache
+import lxml.html
+import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -29,6 +44,64 @@ header_map = {
 }
 
 
+# User agent sent with every request
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36"
+
+# Number of worker processes used to scrape (Selenium) or parse (HTTP) year pages
+NUM_WORKERS = 8
+
+# Maximum number of year pages fetched concurrently over HTTP
+CONCURRENT_REQUESTS = 20
+
+# Random delay range (in seconds) applied before each page load to avoid tripping rate limiters
+REQUEST_JITTER = (0.1, 0.5)
+
+# Selenium WebDriver owned by the current worker process
+_worker_driver = None
+
+# Script reading every data table of a page in one call: the title, subtitle and (class, text, rowspan) cells of every row
+READ_TABLES_SCRIPT = """
+const tables = [];
+for (const container of arguments[0].querySelectorAll("div.container")) {
+    for (const div of container.querySelectorAll("div.ba-table")) {
+        const table = div.querySelector("table.boxed");
+        if (!table || !table.tBodies.length) {
+            continue;
+        }
+        const rows = Array.from(table.tBodies[0].querySelectorAll("tr"));
+        if (!rows.length) {
+            continue;
+        }
+        const h2 = rows[0].querySelector("h2");
+        const p = rows[0].querySelector("p");
+        tables.push({
+            title: h2 && p ? h2.innerText.trim() : rows[0].innerText.trim(),
+            subtitle: h2 && p ? p.innerText.trim() : "",
+            rows: rows.map((tr) =>
+                Array.from(tr.querySelectorAll("td")).map((td) => [
+                    td.className,
+                    td.innerText.trim(),
+                    td.getAttribute("rowspan"),
+                ])
+            ),
+        });
+    }
+}
+return tables;
+"""
+
+# Directory of the on-disk cache of scraped year pages
+SCRAPE_CACHE_DIR = ".scrape_cache"
+
+# On-disk scrape cache, opened lazily by each process
+_scrape_cache = None
+
+# Headers and division parsed from banner rows, keyed by the banner cells
+_HEADER_CACHE = {}
+
+# Row parsers generated by compile_row_parser, keyed by table headers
+_ROW_PARSERS = {}
+
 # CSV file mapping for different table types
 CSV_FILES = {
     "hitters": "hitters_data.csv",
@@ -48,26 +121,89 @@ def pitcher_or_hitter(title, subtitle):
     return None
 
 
+# Function to create the HTTP session used to fetch pages
+def initialize_session():
+    """
+    Create the requests Session used to fetch the page listing the year links.
+    The year pages themselves are fetched with aiohttp in scrape_years_async.
+    """
+    session = requests.Session()
+    session.headers.update(
+        {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"}
+    )
+    return session
+
+
 # Function to initialize the Selenium WebDriver
-def initialize_driver():
-    """Initialize the Selenium WebDriver."""
+def initialize_driver(driver_path=None):
+    """
+    Initialize the Selenium WebDriver.
+    :param driver_path: Path to the chromedriver binary. Installed via ChromeDriverManager if not given.
+    """
     chrome_options = Options()
     chrome_options.add_argument("--headless")  # Run in headless mode
-    chrome_options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36"
-    )
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
 
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--no-sandbox")
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()), options=chrome_options
-    )
+    chrome_options.add_argument("--enable-features=NetworkServiceInProcess")
+    if driver_path is None:
+        driver_path = ChromeDriverManager().install()
+    driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
     return driver
 
 
+# Function to set up the WebDriver for a worker process
+def _init_worker(driver_path):
+    """
+    Pool initializer: start one WebDriver per worker process and quit it when the worker exits.
+    :param driver_path: Path to the chromedriver binary installed by the parent process.
+    """
+    global _worker_driver
+    _worker_driver = initialize_driver(driver_path)
+    multiprocessing.util.Finalize(None, _worker_driver.quit, exitpriority=10)
+
+
+# Function to fetch and parse a page
+def fetch_page(session, url):
+    """
+    Fetch a page and parse it with lxml.
+    :param session: requests Session used for the request.
+    :param url: URL of the page.
+    :return: Root lxml element of the page, with all links made absolute.
+    """
+    response = session.get(url, timeout=10)
+    response.raise_for_status()
+    tree = lxml.html.fromstring(response.content)
+    tree.make_links_absolute(url)
+    return tree
+
+
+# Function to get the text of an lxml element
+def get_text(element):
+    """Return the text of an lxml element as a browser renders it: whitespace collapsed and <br> as a line break."""
+    text = "".join(
+        re.sub(r"\s+", " ", part) if isinstance(part, str) else "\n"
+        for part in element.xpath(".//text() | .//br")
+    )
+    return "\n".join(" ".join(line.split()) for line in text.split("\n")).strip()
+
+
 # Function to find all year links for the American League
-def get_american_league_year_links(driver):
+def get_american_league_year_links(session):
     """Find all year links for the American League."""
+    tree = fetch_page(session, website_url)
+    tables = tree.cssselect("table")
+    american_league_table = tables[
+        1
+    ]  # The second table contains the American League links
+    year_links = american_league_table.cssselect("a")
+    return [link.get("href") for link in year_links]
+
+
+# Function to find all year links for the American League with Selenium
+def get_american_league_year_links_selenium(driver):
+    """Find all year links for the American League using the Selenium WebDriver."""
     driver.get(website_url)
     WebDriverWait(driver, 10).until(
         EC.presence_of_element_located((By.CSS_SELECTOR, "table"))
@@ -80,130 +216,272 @@ def get_american_league_year_links(driver):
     return [link.get_attribute("href") for link in year_links]
 
 
-def get_data(wrapper):
-    """Return types is a tuple of (hitters, pitchers, team_standings, pitcher_leaderboard, hitter_leaderboard) each are dicts with keys: title, subtitle, headers, rows"""
-    containers = wrapper.find_elements(By.CSS_SELECTOR, "div.container")
+def read_tables(wrapper):
+    """
+    Read the data tables of a year page parsed with lxml.
+    :param wrapper: The page's #wrapper element.
+    :return: List of (title, subtitle, rows) tuples, where rows is a list of rows and each row a list of (class, text, rowspan) cell tuples.
+    """
+    tables = []
+    for container in wrapper.cssselect("div.container"):
+        for div in container.cssselect("div.ba-table"):
+            boxed = div.cssselect("table.boxed")
+            if not boxed:
+                continue
+            # Only the first tbody's rows, like table.tBodies[0] in the browser; lxml doesn't
+            # insert a missing tbody, so a table without one has its rows directly under it
+            rows = boxed[0].xpath("./tbody[1]//tr") or boxed[0].xpath("./tr")
+            if not rows:
+                continue
+
+            h2 = rows[0].cssselect("h2")
+            p = rows[0].cssselect("p")
+            if h2 and p:
+                title, subtitle = get_text(h2[0]), get_text(p[0])
+            else:
+                title, subtitle = get_text(rows[0]), ""
+
+            tables.append(
+                (
+                    title,
+                    subtitle,
+                    [
+                        [
+                            (
+                                cell.get("class") or "",
+                                get_text(cell),
+                                cell.get("rowspan"),
+                            )
+                            for cell in row.cssselect("td")
+                        ]
+                        for row in rows
+                    ],
+                )
+            )
+    return tables
+
+
+def read_tables_selenium(driver, wrapper):
+    """
+    Read the data tables of a year page loaded in Selenium.
+    The whole DOM walk runs in the browser in a single execute_script call instead of one WebDriver round-trip per element.
+    :param driver: The Selenium WebDriver.
+    :param wrapper: The page's #wrapper WebElement.
+    :return: List of (title, subtitle, rows) tuples, in the same format as read_tables.
+    """
+    return [
+        (
+            table["title"],
+            table["subtitle"],
+            [[tuple(cell) for cell in row] for row in table["rows"]],
+        )
+        for table in driver.execute_script(READ_TABLES_SCRIPT, wrapper)
+    ]
+
+
+def parse_banner(cells):
+    """
+    Parse a banner row into the table headers and the division it starts.
+    Results are cached by banner cells, so identical banners in different years share one (interned) header list.
+    :param cells: List of (class, text, rowspan) cell tuples of the banner row.
+    :return: Tuple of (headers, current_division), with None as the division if the banner starts none.
+    """
+    key = tuple(cells)
+    if key in _HEADER_CACHE:
+        return _HEADER_CACHE[key]
+
+    headers = []
+    current_division = None
+    for cls, text, rowspan in cells:
+        if "banner middle" in cls and rowspan:
+            if "east" in text.lower() or "west" in text.lower():
+                current_division = text
+                headers.append("Division")
+        elif "banner" in cls:
+            normalized = header_map.get(text, text)
+            headers.append(sys.intern(normalized))
+
+    _HEADER_CACHE[key] = headers, current_division
+    return headers, current_division
+
+
+def parse_row_generic(
+    cells, headers, rowspan_tracker, current_division, previous_row_data
+):
+    """
+    Map the cells of a data row onto the table headers.
+    :param cells: List of (class, text, rowspan) cell tuples of the row.
+    :param headers: List of headers of the table.
+    :param rowspan_tracker: Dict of header index to the value and remaining row count of a cell spanning several rows. Updated in place.
+    :param current_division: Division of the current banner, if any.
+    :param previous_row_data: The previous row, used to fill in missing cells.
+    :return: Dict of header to value.
+    """
+    row_data = {}
+    cell_index = header_index = 0
+
+    while header_index < len(headers):
+        header = headers[header_index]
+
+        if header == "Division" and current_division:
+            row_data["Division"] = current_division
+            header_index += 1
+            continue
+
+        if (
+            header_index in rowspan_tracker
+            and rowspan_tracker[header_index]["remaining"] > 0
+        ):
+            row_data[header] = rowspan_tracker[header_index]["value"]
+            rowspan_tracker[header_index]["remaining"] -= 1
+            header_index += 1
+            continue
+
+        if cell_index >= len(cells):
+            row_data[header] = previous_row_data.get(header, "")
+            header_index += 1
+            continue
+
+        _, text, rowspan = cells[cell_index]
+        if rowspan and rowspan.isdigit():
+            rowspan_tracker[header_index] = {
+                "value": text,
+                "remaining": int(rowspan) - 1,
+            }
+
+        row_data[header] = text
+        cell_index += 1
+        header_index += 1
+
+    return row_data
+
+
+def compile_row_parser(headers):
+    """
+    Generate a row parser specialized for a table's headers.
+    The header loop of parse_row_generic is unrolled into one straight-line block per header.
+    Parsers are cached by headers, so tables sharing a layout across years share a parser.
+    :param headers: List of headers of the table.
+    :return: Function with the same signature and result as parse_row_generic.
+    """
+    key = tuple(headers)
+    if key in _ROW_PARSERS:
+        return _ROW_PARSERS[key]
+
+    lines = [
+        "def parse_row(cells, headers, rowspan_tracker, current_division, previous_row_data):",
+        "    row_data = {}",
+        "    cell_index = 0",
+        "    cell_count = len(cells)",
+    ]
+    for header_index, header in enumerate(headers):
+        indent = "    "
+        if header == "Division":
+            lines += [
+                "    if current_division:",
+                "        row_data['Division'] = current_division",
+                "    else:",
+            ]
+            indent = "        "
+        block = [
+            f"tracked = rowspan_tracker.get({header_index})",
+            "if tracked is not None and tracked['remaining'] > 0:",
+            f"    row_data[{header!r}] = tracked['value']",
+            "    tracked['remaining'] -= 1",
+            "elif cell_index >= cell_count:",
+            f"    row_data[{header!r}] = previous_row_data.get({header!r}, '')",
+            "else:",
+            "    _, text, rowspan = cells[cell_index]",
+            "    if rowspan and rowspan.isdigit():",
+            f"        rowspan_tracker[{header_index}] = {{'value': text, 'remaining': int(rowspan) - 1}}",
+            f"    row_data[{header!r}] = text",
+            "    cell_index += 1",
+        ]
+        lines += [indent + line for line in block]
+    lines.append("    return row_data")
+
+    namespace = {}
+    exec(compile("\n".join(lines), "<row parser>", "exec"), namespace)
+    _ROW_PARSERS[key] = namespace["parse_row"]
+    return _ROW_PARSERS[key]
+
+
+def get_data(tables):
+    """
+    Parse the tables read from a year page (see read_tables).
+    Return types is a tuple of (hitters, pitchers, team_standings, pitcher_leaderboard, hitter_leaderboard) each are dicts with keys: title, subtitle, headers, rows
+    """
     hitters = pitchers = team_standings = None
     pitcher_leaderboard = hitter_leaderboard = None
     table_index = 0
 
-    for container in containers:
-        table_divs = container.find_elements(By.CSS_SELECTOR, "div.ba-table")
-        for div in table_divs:
-            try:
-                table = div.find_element(By.CSS_SELECTOR, "table.boxed")
-                tbody = table.find_element(By.TAG_NAME, "tbody")
-                rows = tbody.find_elements(By.TAG_NAME, "tr")
-
-                if not rows or len(rows) < 3:
+    for title, subtitle, rows in tables:
+        if len(rows) < 3:
+            continue
+
+        try:
+            data_rows = []
+            previous_row_data = {}
+            rowspan_tracker = {}
+            headers = []
+            current_division = None
+            parse_row = parse_row_generic
+
+            row_index = 1
+            while row_index < len(rows) - 2:
+                cells = rows[row_index]
+
+                # Detect banner row with division
+                if any("banner" in cls for cls, _, _ in cells):
+                    headers, current_division = parse_banner(cells)
+                    try:
+                        parse_row = compile_row_parser(headers)
+                    except Exception as e:
+                        print(f"Error compiling row parser for {headers}: {e}")
+                        parse_row = parse_row_generic
+                    row_index += 1
                     continue
 
-                try:
-                    title = rows[0].find_element(By.TAG_NAME, "h2").text.strip()
-                    subtitle = rows[0].find_element(By.TAG_NAME, "p").text.strip()
-                except:
-                    title = rows[0].text.strip()
-                    subtitle = ""
-
-                data_rows = []
-                previous_row_data = {}
-                rowspan_tracker = {}
-                headers = []
-                current_division = None
-
-                row_index = 1
-                while row_index < len(rows) - 2:
-                    row = rows[row_index]
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    cell_classes = [cell.get_attribute("class") or "" for cell in cells]
-
-                    # Detect banner row with division
-                    if any("banner" in cls for cls in cell_classes):
-                        headers = []
-                        current_division = None
-                        for cell in cells:
-                            cls = cell.get_attribute("class") or ""
-                            text = cell.text.strip()
-                            if "banner middle" in cls and cell.get_attribute("rowspan"):
-                                if "east" in text.lower() or "west" in text.lower():
-                                    current_division = text
-                                    headers.append("Division")
-                            elif "banner" in cls:
-                                normalized = header_map.get(text, text)
-                                headers.append(normalized)
-                        row_index += 1
-                        continue
-
-                    # Parse data row
-                    row_data = {}
-                    cell_index = header_index = 0
-
-                    while header_index < len(headers):
-                        header = headers[header_index]
-
-                        if header == "Division" and current_division:
-                            row_data["Division"] = current_division
-                            header_index += 1
-                            continue
-
-                        if (
-                            header_index in rowspan_tracker
-                            and rowspan_tracker[header_index]["remaining"] > 0
-                        ):
-                            row_data[header] = rowspan_tracker[header_index]["value"]
-                            rowspan_tracker[header_index]["remaining"] -= 1
-                            header_index += 1
-                            continue
-
-                        if cell_index >= len(cells):
-                            row_data[header] = previous_row_data.get(header, "")
-                            header_index += 1
-                            continue
-
-                        cell = cells[cell_index]
-                        text = cell.text.strip()
-                        rowspan = cell.get_attribute("rowspan")
-                        if rowspan and rowspan.isdigit():
-                            rowspan_tracker[header_index] = {
-                                "value": text,
-                                "remaining": int(rowspan) - 1,
-                            }
-
-                        row_data[header] = text
-                        cell_index += 1
-                        header_index += 1
-
-                    previous_row_data = row_data.copy()
-                    data_rows.append(row_data)
-                    row_index += 1
+                # Parse data row
+                row_data = parse_row(
+                    cells,
+                    headers,
+                    rowspan_tracker,
+                    current_division,
+                    previous_row_data,
+                )
 
-                review_type = pitcher_or_hitter(title, subtitle)
-                table_data = {
-                    "title": title,
-                    "subtitle": subtitle,
-                    "headers": headers,
-                    "rows": data_rows,
-                }
-
-                if review_type == "pitching":
-                    pitcher_leaderboard = table_data
-                elif review_type == "hitting":
-                    hitter_leaderboard = table_data
-                elif table_index == 0:
-                    hitters = table_data
-                elif table_index == 1:
-                    pitchers = table_data
-                elif (
-                    table_index == 2
-                    and "team standings" in title.lower() + subtitle.lower()
-                ):
-                    team_standings = table_data
-
-                table_index += 1
-
-            except Exception as e:
-                print(f"Error parsing table {table_index}, {title}: {e}")
-                continue
+                previous_row_data = row_data
+                data_rows.append(row_data)
+                row_index += 1
+
+            review_type = pitcher_or_hitter(title, subtitle)
+            table_data = {
+                "title": title,
+                "subtitle": subtitle,
+                "headers": headers,
+                "rows": data_rows,
+            }
+
+            if review_type == "pitching":
+                pitcher_leaderboard = table_data
+            elif review_type == "hitting":
+                hitter_leaderboard = table_data
+            elif table_index == 0:
+                hitters = table_data
+            elif table_index == 1:
+                pitchers = table_data
+            elif (
+                table_index == 2
+                and "team standings" in title.lower() + subtitle.lower()
+            ):
+                team_standings = table_data
+
+            table_index += 1
+
+        except Exception as e:
+            print(f"Error parsing table {table_index}, {title}: {e}")
+            continue
 
     return (
         hitters,
@@ -214,23 +492,16 @@ def get_data(wrapper):
     )
 
 
-# Function to scrape a single year page
-def scrape_year_page(driver, year_url, year):
-    """Scrape data from a single year page. returns a dict with keys as table types and values as dictionaries with keys: headers, title, subtitle, rows."""
-    driver.get(year_url)
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, "#wrapper"))
-    )
-    main = driver.find_element(By.CSS_SELECTOR, "body").find_element(
-        By.CSS_SELECTOR, "#wrapper"
-    )
+# Function to group parsed tables by table type
+def tables_by_type(tables):
+    """Parse the tables read from a year page and return a dict with keys as table types and values as dictionaries with keys: headers, title, subtitle, rows."""
     (
         hitters,
         pitchers,
         team_standings,
         pitcher_leaderboard,
         hitter_leaderboard,
-    ) = get_data(main)
+    ) = get_data(tables)
 
     return {
         "hitters": hitters,
@@ -241,51 +512,256 @@ def scrape_year_page(driver, year_url, year):
     }
 
 
-# Function to save data to CSV files
-def save_data_to_csv(data, headers, csv_file, start_id=1, year=None):
+# Function to open the on-disk scrape cache
+def get_scrape_cache():
+    """Open the on-disk cache of scraped year pages for the current process."""
+    global _scrape_cache
+    if _scrape_cache is None:
+        _scrape_cache = diskcache.Cache(SCRAPE_CACHE_DIR)
+    return _scrape_cache
+
+
+# Function to build the scrape cache key of a page
+def cache_key(year_url):
+    """Return the scrape cache key of a year page: the MD5 of its URL."""
+    return hashlib.md5(year_url.encode("utf-8")).hexdigest()
+
+
+# Function to look up a scraped year page in the cache
+def get_cached_year(year_url):
+    """Return the cached table data of a year page, or None if it hasn't been scraped yet."""
+    return get_scrape_cache().get(cache_key(year_url))
+
+
+# Function to store a scraped year page in the cache
+def cache_year(year_url, year, year_table_data):
     """
-    Save data to a CSV file. Adds a unique ID and year to each row.
-    :param data: List of dictionaries representing rows of data.
-    :param headers: List of headers for the CSV file.
-    :param csv_file: Path to the CSV file.
-    :param start_id: Starting value for the unique ID.
-    :param year: The year to add to each row.
+    Store the table data of a year page, keyed by the MD5 of the page URL.
+    Entries are tagged with the year so a single season can be invalidated with invalidate_year.
+    """
+    get_scrape_cache().set(cache_key(year_url), year_table_data, tag=str(year))
+
+
+# Decorator to cache scraped year pages on disk
+def cache_by_url(scrape):
+    """Cache the result of a year page scrape on disk with get_cached_year and cache_year."""
+
+    @functools.wraps(scrape)
+    def wrapper(client, year_url, year):
+        year_table_data = get_cached_year(year_url)
+        if year_table_data is None:
+            year_table_data = scrape(client, year_url, year)
+            cache_year(year_url, year, year_table_data)
+        return year_table_data
+
+    return wrapper
+
+
+# Function to drop a year from the scrape cache
+def invalidate_year(year):
+    """Remove the cached pages of a year so the next run scrapes it again."""
+    with diskcache.Cache(SCRAPE_CACHE_DIR) as cache:
+        cache.evict(str(year))
+
+
+# Function to scrape a single year page with Selenium
+@cache_by_url
+def scrape_year_page_selenium(driver, year_url, year):
+    """Scrape data from a single year page using the Selenium WebDriver. Returns the same dict as parse_year_page."""
+    time.sleep(random.uniform(*REQUEST_JITTER))
+    driver.get(year_url)
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "#wrapper"))
+    )
+    main = driver.find_element(By.ID, "wrapper")
+    return tables_by_type(read_tables_selenium(driver, main))
+
+
+# Function to extract the year from a year page URL
+def get_year_from_url(year_url):
+    """Extract the year from a year page URL (e.g. .../yr1901a.shtml -> "1901")."""
+    return year_url.split("yr")[-1][:4]
+
+
+# Function to scrape a single year page inside a worker process
+def _scrape_one(year_url):
+    """
+    Scrape a single year page with the worker's WebDriver.
+    :param year_url: URL of the year page.
+    :return: Tuple of (year_url, table data dict), with None as the table data if scraping failed.
+    """
+    year = get_year_from_url(year_url)
+    print(f"Scraping data for year {year}...")
+    try:
+        return year_url, scrape_year_page_selenium(_worker_driver, year_url, year)
+    except Exception as e:
+        print(f"Error scraping year {year}: {e}")
+        return year_url, None
+
+
+# Function to scrape year pages with a pool of Selenium workers
+def scrape_years_selenium(year_links, driver_path, processes=NUM_WORKERS):
+    """
+    Scrape year pages in parallel with a pool of worker processes, each owning its own WebDriver.
+    :param year_links: List of year page URLs.
+    :param driver_path: Path to the chromedriver binary.
+    :param processes: Number of worker processes.
+    :return: Dict of year page URL to table data dict (None if scraping failed).
     """
-    file_exists = os.path.isfile(csv_file)
-    with open(csv_file, mode="a", newline="", encoding="utf-8") as file:
-        # Add "id" and "year" to the headers for the unique identifier and year
-        headers_with_id_and_year = ["id", "year"] + headers
-        writer = csv.DictWriter(file, fieldnames=headers_with_id_and_year)
+    results = {}
+    pool = multiprocessing.Pool(
+        processes=processes, initializer=_init_worker, initargs=(driver_path,)
+    )
+    try:
+        for year_url, year_table_data in pool.imap_unordered(
+            _scrape_one, year_links, chunksize=1
+        ):
+            results[year_url] = year_table_data
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return results
 
-        if not file_exists:
-            writer.writeheader()
 
-        # Add a unique ID and year to each row and write to the file
-        for i, row in enumerate(data, start=start_id):
-            # Filter out unexpected fields
-            filtered_row = {key: row[key] for key in headers if key in row}
-            row_with_id_and_year = {"id": i, "year": year}  # Add unique ID and year
-            row_with_id_and_year.update(filtered_row)
-            writer.writerow(row_with_id_and_year)
+# Function to parse the HTML of a year page
+def parse_year_page(content):
+    """Parse the HTML of a year page. returns a dict with keys as table types and values as dictionaries with keys: headers, title, subtitle, rows."""
+    tree = lxml.html.fromstring(content)
+    return tables_by_type(read_tables(tree.get_element_by_id("wrapper")))
+
+
+# Function to fetch a year page asynchronously
+async def fetch_year(session, semaphore, year_url):
+    """
+    Fetch the HTML of a year page.
+    :param session: aiohttp ClientSession used for the request.
+    :param semaphore: Semaphore bounding the number of requests in flight.
+    :param year_url: URL of the year page.
+    :return: The page content as bytes.
+    """
+    async with semaphore:
+        await asyncio.sleep(random.uniform(*REQUEST_JITTER))
+        async with session.get(year_url) as response:
+            response.raise_for_status()
+            return await response.read()
+
+
+# Function to scrape year pages concurrently over HTTP
+async def scrape_years_async(year_links, processes=NUM_WORKERS):
+    """
+    Fetch year pages concurrently in one event loop and parse them in a process pool.
+    Pages found in the scrape cache are not fetched again.
+    :param year_links: List of year page URLs.
+    :param processes: Number of parser processes.
+    :return: Dict of year page URL to table data dict (None if scraping failed).
+    """
+    results = {}
+    semaphore = asyncio.Semaphore(CONCURRENT_REQUESTS)
+    loop = asyncio.get_running_loop()
+
+    async def scrape(session, executor, year_url):
+        year = get_year_from_url(year_url)
+        results[year_url] = get_cached_year(year_url)
+        if results[year_url] is not None:
+            return
+
+        print(f"Scraping data for year {year}...")
+        try:
+            content = await fetch_year(session, semaphore, year_url)
+            results[year_url] = await loop.run_in_executor(
+                executor, parse_year_page, content
+            )
+            cache_year(year_url, year, results[year_url])
+        except Exception as e:
+            print(f"Error scraping year {year}: {e}")
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        async with aiohttp.ClientSession(
+            headers={"User-Agent": USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as session:
+            await asyncio.gather(
+                *(scrape(session, executor, year_url) for year_url in year_links)
+            )
+    return results
+
+
+# Function to build the temporary path a CSV file is written to
+def temp_csv_path(table_type):
+    """Return the temporary file a table type's rows are written to before replacing its CSV file."""
+    return CSV_FILES[table_type] + ".tmp"
+
+
+# Function to append rows to an open CSV file
+def append_rows(writer, headers, rows, start_id=1, year=None):
+    """
+    Append rows to an open CSV file. Adds a unique ID and year to each row.
+    :param writer: csv.writer for the CSV file.
+    :param headers: List of headers for the rows.
+    :param rows: List of dictionaries representing rows of data.
+    :param start_id: Starting value for the unique ID.
+    :param year: The year to add to each row.
+    """
+    for i, row in enumerate(rows, start=start_id):
+        # Write the unique ID and year, then the fields in header order (missing fields are left empty)
+        writer.writerow([i, year] + [row.get(header, "") for header in headers])
 
 
 # Function to scrape all years for the American League
-def scrape_american_league():
+def scrape_american_league(processes=NUM_WORKERS, use_selenium=False):
     """
     Scrape data for all years in the American League.
+    Year pages are fetched concurrently over HTTP and parsed in a process pool, or, with Selenium, scraped by a pool of worker processes each owning its own WebDriver.
     Saves data to CSV files with unique IDs and year for each row.
+    :param processes: Number of worker processes.
+    :param use_selenium: Render pages in headless Chrome instead of fetching them with plain HTTP requests.
+    :return: List of the years that could not be scraped; the CSV files are left unchanged if there are any.
     """
-    driver = initialize_driver()
-    year_links = get_american_league_year_links(driver)
+    if use_selenium:
+        # Install the driver binary once so every worker reuses it
+        driver_path = ChromeDriverManager().install()
+        driver = initialize_driver(driver_path)
+        try:
+            year_links = get_american_league_year_links_selenium(driver)
+        finally:
+            driver.quit()
+        results = scrape_years_selenium(year_links, driver_path, processes)
+    else:
+        with initialize_session() as session:
+            year_links = get_american_league_year_links(session)
+        results = asyncio.run(scrape_years_async(year_links, processes))
+
+    # Don't replace the CSV files with data missing some seasons. The scraped years are cached,
+    # so running again only fetches the years that failed
+    failed_years = [
+        get_year_from_url(year_url)
+        for year_url in year_links
+        if results.get(year_url) is None
+    ]
+    if failed_years:
+        print(
+            f"Could not scrape {len(failed_years)} year(s): {', '.join(failed_years)}. "
+            "Keeping the existing CSV files; run again to retry them."
+        )
+        return failed_years
+
     row_counters = {
         key: 1 for key in CSV_FILES.keys()
     }  # Track unique IDs for each table type
 
+    # Write each table type to a temporary file, opened when its first valid table arrives.
+    # The CSV files are only replaced once the run has finished, so a failed run keeps the old data
+    csv_files = {}
+    writers = {}
+    completed = False
     try:
-        for i, year_url in enumerate(year_links):
-            year = year_url.split("yr")[-1][:4]  # Extract the year from the URL
-            print(f"Scraping data for year {year}...")
-            year_table_data = scrape_year_page(driver, year_url, year)
+        # Write the results serially, in year order, so IDs stay sequential
+        for year_url in year_links:
+            year = get_year_from_url(year_url)
+            year_table_data = results[year_url]
 
             # Process and save data for each table type
             for table_type, table in year_table_data.items():
@@ -293,22 +769,75 @@ def scrape_american_league():
                     print(f"Skipping invalid table for year {year}.")
                     continue  # Skip invalid tables
 
-                # Save headers and rows to the corresponding CSV file
-                save_data_to_csv(
-                    data=table["rows"],
+                if table_type not in writers:
+                    csv_files[table_type] = open(
+                        temp_csv_path(table_type),
+                        mode="w",
+                        newline="",
+                        encoding="utf-8",
+                    )
+                    writers[table_type] = csv.writer(csv_files[table_type])
+                    # Add "id" and "year" to the headers for the unique identifier and year
+                    writers[table_type].writerow(["id", "year"] + table["headers"])
+
+                # Save rows to the corresponding CSV file
+                append_rows(
+                    writers[table_type],
                     headers=table["headers"],
-                    csv_file=CSV_FILES[table_type],
+                    rows=table["rows"],
                     start_id=row_counters[table_type],
                     year=year,  # Pass the year to save in each row
                 )
 
                 # Update the row counter for the next batch
                 row_counters[table_type] += len(table["rows"])
-
+        completed = True
     finally:
-        driver.quit()
+        for file in csv_files.values():
+            file.close()
+        for table_type in csv_files:
+            if completed:
+                os.replace(temp_csv_path(table_type), CSV_FILES[table_type])
+            else:
+                os.remove(temp_csv_path(table_type))
+
+    # Table types with no valid table in any year keep their existing CSV file
+    for table_type, csv_file in CSV_FILES.items():
+        if table_type not in csv_files:
+            print(f"No data scraped for {table_type}, keeping {csv_file} unchanged.")
+
+    return failed_years
 
 
 # Main entry point
 if __name__ == "__main__":
-    scrape_american_league()
+    parser = argparse.ArgumentParser(
+        description="Scrape American League data from baseball-almanac.com."
+    )
+    parser.add_argument(
+        "--selenium",
+        action="store_true",
+        help="Render pages in headless Chrome instead of fetching them over plain HTTP.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Clear the cache of scraped year pages before scraping.",
+    )
+    parser.add_argument(
+        "--refresh-year",
+        action="append",
+        default=[],
+        metavar="YEAR",
+        help="Scrape YEAR again even if it is cached. May be given several times.",
+    )
+    args = parser.parse_args()
+
+    if args.no_cache:
+        with diskcache.Cache(SCRAPE_CACHE_DIR) as cache:
+            cache.clear()
+    for year in args.refresh_year:
+        invalidate_year(year)
+
+    if scrape_american_league(use_selenium=args.selenium):
+        sys.exit(1)
@@ -1,16 +1,30 @@
+import logging
 import dash
 from dash import dcc, html, Input, Output
+from flask_caching import Cache
 import pandas as pd
 import data_cleaner
 
-# Load and process the data
-cleaned_dataframes = data_cleaner.load_and_process_dataframes()
+log = logging.getLogger(__name__)
+
+# Load the cleaned data from the Feather cache, rebuilding it if the CSV files changed
+cleaned_dataframes = None
+if data_cleaner.cache_fresh():
+    try:
+        cleaned_dataframes = data_cleaner.load_cached_dataframes()
+    except Exception as e:
+        log.warning("Could not read the cached data, rebuilding it: %s", e)
+if cleaned_dataframes is None:
+    cleaned_dataframes = data_cleaner.build_cache()
 
 # Initialize the Dash app
 app = dash.Dash(__name__)
 app.title = "Baseball Data Dashboard"
 server = app.server  # Expose the server variable for deployments
 
+# Cache callback outputs per selected year; the data never changes after loading
+cache = Cache(server, config={"CACHE_TYPE": "SimpleCache"})
+
 # Extract unique years from the team standings and leaderboard data
 team_standings_df = cleaned_dataframes["team_standings"]
 hitter_leaderboard_df = cleaned_dataframes["hitter_leaderboard"]
@@ -25,7 +39,49 @@ pitcher_leaderboard_df["year"] = pd.to_numeric(
     pitcher_leaderboard_df["year"], errors="coerce"
 )
 
-unique_years = sorted(team_standings_df["year"].dropna().unique())
+# Narrow the dtypes: years and win/loss counts fit in int16 and the repeated strings become categoricals
+team_standings_df = team_standings_df.dropna(subset=["year"]).astype(
+    {"year": "int16", "wins": "int16", "losses": "int16", "team_roster": "category"}
+)
+hitter_leaderboard_df = hitter_leaderboard_df.dropna(subset=["year"]).astype(
+    {"year": "int16", "statistic": "category", "team": "category"}
+)
+pitcher_leaderboard_df = pitcher_leaderboard_df.dropna(subset=["year"]).astype(
+    {"year": "int16", "statistic": "category", "team": "category"}
+)
+
+years = team_standings_df["year"].unique()
+years.sort()
+unique_years = years.tolist()
+
+# Dropdown options for the years, built once
+YEAR_OPTIONS = [{"label": year, "value": year} for year in unique_years]
+
+# Index the data by year once so the callbacks don't rescan whole DataFrames on every selection
+TEAM_STANDINGS_BY_YEAR = {
+    year: group for year, group in team_standings_df.groupby("year", sort=False)
+}
+HITTER_LEADERBOARD_BY_YEAR = {
+    year: group for year, group in hitter_leaderboard_df.groupby("year", sort=False)
+}
+PITCHER_LEADERBOARD_BY_YEAR = {
+    year: group for year, group in pitcher_leaderboard_df.groupby("year", sort=False)
+}
+
+# Hitter leaderboard sorted by year, for range lookups in the trend chart
+hitter_leaderboard_sorted_df = hitter_leaderboard_df.set_index(
+    "year", drop=False
+).sort_index(kind="stable")
+
+# Styles shared by every generated table
+CELL_STYLE = {"padding": "10px", "border": "1px solid #6a0dad"}
+TABLE_STYLE = {
+    "width": "100%",
+    "borderCollapse": "collapse",
+    "margin": "0 auto 1rem",
+    "color": "#6a0dad",
+    "backgroundColor": "#f8f0ff",
+}
 
 # Define the layout of the app
 app.layout = html.Div(
@@ -46,7 +102,7 @@ app.layout = html.Div(
                 html.Label("Select a Year:", style={"color": "#6a0dad"}),
                 dcc.Dropdown(
                     id="year-dropdown",
-                    options=[{"label": year, "value": year} for year in unique_years],
+                    options=YEAR_OPTIONS,
                     value=unique_years[0],  # Default to the first year
                     clearable=False,
                     style={"color": "#6a0dad"},
@@ -121,51 +177,101 @@ def generate_table(dataframe):
 
     return html.Table(
         # Table header
-        [
-            html.Tr(
-                [
-                    html.Th(
-                        col, style={"padding": "10px", "border": "1px solid #6a0dad"}
-                    )
-                    for col in dataframe.columns
-                ]
-            )
-        ]
-        +
+        [html.Tr([html.Th(col, style=CELL_STYLE) for col in dataframe.columns])] +
         # Table rows
         [
-            html.Tr(
-                [
-                    html.Td(
-                        row[col],
-                        style={"padding": "10px", "border": "1px solid #6a0dad"},
-                    )
-                    for col in dataframe.columns
-                ]
-            )
-            for _, row in dataframe.iterrows()
+            html.Tr([html.Td(value, style=CELL_STYLE) for value in row])
+            for row in dataframe.to_numpy()
         ],
-        style={
-            "width": "100%",
-            "borderCollapse": "collapse",
-            "margin": "0 auto 1rem",
-            "color": "#6a0dad",
-            "backgroundColor": "#f8f0ff",
-        },
+        style=TABLE_STYLE,
     )
 
 
+# Helper function to generate the wins and losses chart for a year
+def generate_wins_losses_figure(year, dataframe):
+    return {
+        "data": [
+            {
+                "x": dataframe["team_roster"].tolist(),
+                "y": dataframe["wins"].tolist(),
+                "type": "bar",
+                "name": "Wins",
+                "marker": {"color": "#6a0dad"},
+            },
+            {
+                "x": dataframe["team_roster"].tolist(),
+                "y": dataframe["losses"].tolist(),
+                "type": "bar",
+                "name": "Losses",
+                "marker": {"color": "#e6e6fa"},
+            },
+        ],
+        "layout": {
+            "title": f"Wins and Losses for {year}",
+            "xaxis": {"title": "Teams"},
+            "yaxis": {"title": "Wins/Losses"},
+            "barmode": "group",
+        },
+    }
+
+
+# Helper function to generate the pitcher leaderboard chart for a year
+def generate_pitcher_leaderboard_figure(year, dataframe):
+    return {
+        "data": [
+            {
+                "x": dataframe["statistic"].tolist(),
+                "y": dataframe["value"].tolist(),
+                "type": "scatter",
+                "mode": "lines+markers",
+                "name": "Pitcher Stats",
+                "line": {"color": "#6a0dad"},
+            }
+        ],
+        "layout": {
+            "title": f"Pitcher Leaderboard for {year}",
+            "xaxis": {"title": "Statistic"},
+            "yaxis": {"title": "Value"},
+        },
+    }
+
+
+# Figures shown when there is no data for the selected year
+EMPTY_FIGURE = {
+    "data": [],
+    "layout": {"title": "No data available for the selected year"},
+}
+EMPTY_WINS_LOSSES_FIGURE = {
+    "data": [],
+    "layout": {
+        "title": "No data available for the selected year",
+        "xaxis": {"title": "Teams"},
+        "yaxis": {"title": "Wins/Losses"},
+    },
+}
+
+# Build the charts of every year once; the data doesn't change after loading
+WINS_LOSSES_FIGURES = {
+    year: generate_wins_losses_figure(year, group)
+    for year, group in TEAM_STANDINGS_BY_YEAR.items()
+}
+PITCHER_LEADERBOARD_FIGURES = {
+    year: generate_pitcher_leaderboard_figure(year, group)
+    for year, group in PITCHER_LEADERBOARD_BY_YEAR.items()
+}
+
+
 # Callback to update the team standings table based on the selected year
 @app.callback(
     Output("team-standings-table", "children"),
     Input("year-dropdown", "value"),
 )
+@cache.memoize(timeout=0)
 def update_team_standings_table(selected_year):
-    filtered_df = team_standings_df[team_standings_df["year"] == selected_year]
+    filtered_df = TEAM_STANDINGS_BY_YEAR.get(selected_year, team_standings_df.iloc[:0])
 
     # Debugging
-    print(f"Team Standings Data for Year {selected_year}:")
-    print(filtered_df)
+    log.debug("Team Standings Data: year=%s rows=%d", selected_year, len(filtered_df))
 
     if filtered_df.empty:
         return html.P("No data available for the selected year.")
@@ -181,39 +287,37 @@ def update_team_standings_table(selected_year):
     ],
     Input("year-dropdown", "value"),
 )
+@cache.memoize(timeout=0)
 def update_hitter_leaderboard(selected_year):
     # Filter the DataFrame for the selected year
-    filtered_df = hitter_leaderboard_df[hitter_leaderboard_df["year"] == selected_year]
+    filtered_df = HITTER_LEADERBOARD_BY_YEAR.get(
+        selected_year, hitter_leaderboard_df.iloc[:0]
+    )
 
     # Debugging
-    print(f"Hitter Leaderboard Data for Year {selected_year}:")
-    print(filtered_df)
+    log.debug(
+        "Hitter Leaderboard Data: year=%s rows=%d", selected_year, len(filtered_df)
+    )
 
     if filtered_df.empty:
-        return html.P("No data available for the selected year."), {
-            "data": [],
-            "layout": {"title": "No data available for the selected year"},
-        }
+        return html.P("No data available for the selected year."), EMPTY_FIGURE
 
     # Determine the range of years for the trend chart
     min_year = max(hitter_leaderboard_df["year"].min(), selected_year - 5)
     max_year = min(hitter_leaderboard_df["year"].max(), selected_year + 5)
-    trend_df = hitter_leaderboard_df[
-        (hitter_leaderboard_df["year"] >= min_year)
-        & (hitter_leaderboard_df["year"] <= max_year)
-    ]
+    trend_df = hitter_leaderboard_sorted_df.loc[min_year:max_year]
 
     # Generate a trend chart for hitter leaderboard
     trend_chart = {
         "data": [
             {
-                "x": trend_df[trend_df["statistic"] == stat]["year"],
-                "y": trend_df[trend_df["statistic"] == stat]["value"],
+                "x": group["year"].to_numpy(),
+                "y": group["value"].to_numpy(),
                 "type": "scatter",
                 "mode": "lines+markers",
                 "name": stat,
             }
-            for stat in trend_df["statistic"].unique()
+            for stat, group in trend_df.groupby("statistic", sort=False, observed=True)
         ],
         "layout": {
             "title": f"Hitter Leaderboard Trend ({min_year}-{max_year})",
@@ -233,41 +337,21 @@ def update_hitter_leaderboard(selected_year):
     ],
     Input("year-dropdown", "value"),
 )
+@cache.memoize(timeout=0)
 def update_pitcher_leaderboard(selected_year):
-    filtered_df = pitcher_leaderboard_df[
-        pitcher_leaderboard_df["year"] == selected_year
-    ]
+    filtered_df = PITCHER_LEADERBOARD_BY_YEAR.get(
+        selected_year, pitcher_leaderboard_df.iloc[:0]
+    )
 
     # Debugging
-    print(f"Pitcher Leaderboard Data for Year {selected_year}:")
-    print(filtered_df)
+    log.debug(
+        "Pitcher Leaderboard Data: year=%s rows=%d", selected_year, len(filtered_df)
+    )
 
     if filtered_df.empty:
-        return html.P("No data available for the selected year."), {
-            "data": [],
-            "layout": {"title": "No data available for the selected year"},
-        }
-
-    # Generate a line chart for pitcher leaderboard
-    line_chart = {
-        "data": [
-            {
-                "x": filtered_df["statistic"],
-                "y": filtered_df["value"],
-                "type": "scatter",
-                "mode": "lines+markers",
-                "name": "Pitcher Stats",
-                "line": {"color": "#6a0dad"},
-            }
-        ],
-        "layout": {
-            "title": f"Pitcher Leaderboard for {selected_year}",
-            "xaxis": {"title": "Statistic"},
-            "yaxis": {"title": "Value"},
-        },
-    }
+        return html.P("No data available for the selected year."), EMPTY_FIGURE
 
-    return generate_table(filtered_df), line_chart
+    return generate_table(filtered_df), PITCHER_LEADERBOARD_FIGURES[selected_year]
 
 
 # Callback to update the wins and losses chart based on the selected year
@@ -276,48 +360,10 @@ def update_pitcher_leaderboard(selected_year):
     Input("year-dropdown", "value"),
 )
 def update_wins_losses_chart(selected_year):
-    filtered_df = team_standings_df[team_standings_df["year"] == selected_year]
-
     # Debugging
-    print(f"Wins and Losses Data for Year {selected_year}:")
-    print(filtered_df)
-
-    if filtered_df.empty:
-        return {
-            "data": [],
-            "layout": {
-                "title": "No data available for the selected year",
-                "xaxis": {"title": "Teams"},
-                "yaxis": {"title": "Wins/Losses"},
-            },
-        }
-
-    figure = {
-        "data": [
-            {
-                "x": filtered_df["team_roster"],
-                "y": filtered_df["wins"],
-                "type": "bar",
-                "name": "Wins",
-                "marker": {"color": "#6a0dad"},
-            },
-            {
-                "x": filtered_df["team_roster"],
-                "y": filtered_df["losses"],
-                "type": "bar",
-                "name": "Losses",
-                "marker": {"color": "#e6e6fa"},
-            },
-        ],
-        "layout": {
-            "title": f"Wins and Losses for {selected_year}",
-            "xaxis": {"title": "Teams"},
-            "yaxis": {"title": "Wins/Losses"},
-            "barmode": "group",
-        },
-    }
+    log.debug("Wins and Losses Chart: year=%s", selected_year)
 
-    return figure
+    return WINS_LOSSES_FIGURES.get(selected_year, EMPTY_WINS_LOSSES_FIGURE)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,11 @@
+import csv
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
 import pandas as pd
+import pyarrow.feather as feather
 
 # File paths for the CSV files
 CSV_FILES = {
@@ -9,6 +16,26 @@ CSV_FILES = {
     "pitcher_leaderboard": "pitcher_leaderboard_data.csv",
 }
 
+# Directory for the Feather copies of the cleaned DataFrames
+CACHE_DIR = "cache"
+
+# Text columns are kept in Arrow string arrays; missing values stay NaN like in the numeric columns
+STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+
+# Repeated string columns of the leaderboards, stored as categoricals so duplicates are found by hashing integer codes
+CATEGORY_COLUMNS = ("team", "statistic")
+
+
+def to_categories(df):
+    """
+    Convert the repeated string columns of a DataFrame to categoricals.
+    :param df: DataFrame to convert.
+    :return: DataFrame with the CATEGORY_COLUMNS it has stored as categoricals.
+    """
+    return df.astype(
+        {column: "category" for column in CATEGORY_COLUMNS if column in df.columns}
+    )
+
 
 def clean_hitters(df):
     """
@@ -16,11 +43,12 @@ def clean_hitters(df):
     :param df: DataFrame containing hitters data.
     :return: Cleaned DataFrame.
     """
-    # Drop rows with missing values in critical columns
-    df = df.dropna(subset=["name", "team"])
-    # Remove duplicates
-    df = df.drop_duplicates()
-    return df
+    return (
+        # Drop rows with missing values in critical columns
+        df.dropna(subset=["name", "team"])
+        # Remove duplicates; the scraper gives every row its own id, so only that column is hashed
+        .drop_duplicates(subset=["id"], keep="first")
+    )
 
 
 def clean_pitchers(df):
@@ -29,12 +57,14 @@ def clean_pitchers(df):
     :param df: DataFrame containing pitchers data.
     :return: Cleaned DataFrame.
     """
-    # Drop rows with missing values in critical columns
-    df = df.dropna(subset=["name", "team"])
-    # Remove duplicates
-    df = df.drop_duplicates()
+    df = (
+        # Drop rows with missing values in critical columns
+        df.dropna(subset=["name", "team"])
+        # Remove duplicates; the scraper gives every row its own id, so only that column is hashed
+        .drop_duplicates(subset=["id"], keep="first")
+    )
     # Reset index
-    df = df.reset_index(drop=True)
+    df.index = pd.RangeIndex(len(df))
     return df
 
 
@@ -45,43 +75,47 @@ def clean_team_standings(df):
     :return: Cleaned DataFrame.
     """
 
-    # Function to fix misaligned rows
-    def fix_misaligned_row(row):
-        if pd.isna(row["team_roster"]) or row["team_roster"] == "":
-            # Attempt to infer the team_roster from other columns
-            if pd.notna(row["wins"]) and isinstance(row["wins"], str):
-                row["team_roster"] = row["wins"]
-                row["wins"] = row["losses"]
-                row["losses"] = row["win_percentage"]
-                row["win_percentage"] = row["games_behind"]
-                row["games_behind"] = None
-        elif row["team_roster"] in ["East", "West"]:
-            # Retain rows with East/West in team_roster without dropping them
-            pass  # No changes needed; keep the row as is
-        return row
-
-    # Apply the fix for misaligned rows
-    df = df.apply(fix_misaligned_row, axis=1)
+    # Fix misaligned rows: a missing team_roster means the team name was read into wins,
+    # so shift wins..games_behind one column to the left
+    missing_roster = df["team_roster"].isna() | df["team_roster"].eq("")
+    misaligned = missing_roster & df["wins"].map(type).eq(str)
+    df.loc[misaligned, ["team_roster", "wins", "losses", "win_percentage"]] = df.loc[
+        misaligned, ["wins", "losses", "win_percentage", "games_behind"]
+    ].to_numpy()
+    df.loc[misaligned, "games_behind"] = None
+    # Rows with East/West in team_roster are kept as they are
 
     # Keep rows where team_roster is not purely numeric
-    df = df.loc[df["team_roster"].astype(str).str.isnumeric() == False]
-
-    # Ensure numeric columns are properly converted
-    df["wins"] = pd.to_numeric(df["wins"], errors="coerce")
-    df["losses"] = pd.to_numeric(df["losses"], errors="coerce")
-    df["win_percentage"] = pd.to_numeric(df["win_percentage"], errors="coerce")
-    df["games_behind"] = pd.to_numeric(
-        df["games_behind"].astype(str).str.replace("½", ".5"), errors="coerce"
+    df = df.loc[
+        ~df["team_roster"]
+        .astype(STRING_DTYPE)
+        .str.isnumeric()
+        .fillna(False)
+        .to_numpy(dtype=bool)
+    ]
+
+    # Half games are written as "½"; only rewrite the column when some row has one
+    games_behind = df["games_behind"].astype(STRING_DTYPE)
+    if games_behind.str.contains("½", regex=False, na=False).any():
+        games_behind = games_behind.str.replace("½", ".5", regex=False)
+
+    # Ensure numeric columns are properly converted, in a single assign
+    df = df.assign(
+        **{
+            column: pd.to_numeric(df[column], errors="coerce")
+            for column in ["wins", "losses", "win_percentage"]
+        },
+        games_behind=pd.to_numeric(games_behind, errors="coerce"),
     )
 
     # Drop rows with missing or invalid numeric data
-    df = df.dropna(subset=["wins", "losses", "win_percentage"])
+    df.dropna(subset=["wins", "losses", "win_percentage"], inplace=True)
 
     # Remove duplicates
-    df = df.drop_duplicates()
+    df.drop_duplicates(inplace=True)
 
     # Reset the index
-    df = df.reset_index(drop=True)
+    df.index = pd.RangeIndex(len(df))
 
     return df
 
@@ -117,9 +151,9 @@ def clean_leaderboard(df):
     try:
         df["value"] = (
             df["value"]
-            .astype(str)
-            .str.replace(",", "")  # Remove commas
-            .str.replace('"', "")  # Remove quotes
+            .astype(STRING_DTYPE)
+            .str.replace(",", "", regex=False)  # Remove commas
+            .str.replace('"', "", regex=False)  # Remove quotes
             .str.strip()  # Remove leading/trailing whitespace
         )
         df["value"] = pd.to_numeric(df["value"], errors="coerce")  # Convert to numeric
@@ -127,80 +161,139 @@ def clean_leaderboard(df):
         print("Error while converting 'value' to numeric:", e)
 
     # Remove duplicates
-    df = df.drop_duplicates()
+    df = to_categories(df).drop_duplicates()
 
     # Reset the index
-    df = df.reset_index(drop=True)
+    df.index = pd.RangeIndex(len(df))
 
     return df
 
 
-def load_csv_with_fallback(file_path, expected_columns):
+def load_csv_with_fallback(file_path, expected_columns, column_types=None):
     """
     Load a CSV file and ensure it has the expected columns.
     Handles inconsistent rows by dynamically adjusting columns.
+    Rows with extra columns are truncated and rows with missing columns are padded with empty strings by pandas' C parser.
     :param file_path: Path to the CSV file.
     :param expected_columns: List of expected column names.
+    :param column_types: Optional dictionary of dtypes for columns the parser should convert; other columns are read as strings.
     :return: DataFrame with the expected columns.
     """
-    rows = []
-    max_columns = len(expected_columns)
-
-    with open(file_path, "r", encoding="utf-8") as file:
-        for line_number, line in enumerate(file, start=1):
-            try:
-                # Parse the line into columns
-                row = line.strip().split(",")
-                if len(row) > max_columns:
-                    # If the row has extra columns, truncate it
-                    # print(
-                    #     f"Truncating extra columns at line {line_number}: {line.strip()}"
-                    # )
-                    row = row[:max_columns]
-                elif len(row) < max_columns:
-                    # If the row has missing columns, pad with empty strings
-                    print(
-                        f"Padding missing columns at line {line_number}: {line.strip()}"
-                    )
-                    row.extend([""] * (max_columns - len(row)))
-                rows.append(row)
-            except Exception as e:
-                print(f"Error processing row at line {line_number}: {e}")
-
-    # Create a DataFrame from the collected rows
-    df = pd.DataFrame(rows, columns=expected_columns)
+    read_options = {
+        "names": expected_columns,
+        "header": None,
+        "skiprows": 1,
+        # Reading only the expected columns truncates longer rows and pads shorter ones
+        "usecols": range(len(expected_columns)),
+        "na_filter": False,
+        # Let the parser read the file through a memory map instead of buffered reads
+        "memory_map": True,
+        # Split on every comma, like the scraper's rows were written
+        "quoting": csv.QUOTE_NONE,
+        "engine": "c",
+    }
 
-    return df
+    if column_types:
+        try:
+            return pd.read_csv(
+                file_path,
+                dtype={**dict.fromkeys(expected_columns, STRING_DTYPE), **column_types},
+                **read_options,
+            )
+        except ValueError as e:
+            print(f"Could not convert columns of {file_path}, reading them as text:", e)
+
+    return pd.read_csv(file_path, dtype=STRING_DTYPE, **read_options)
+
+
+def read_csv_skipping_bad_lines(file_path):
+    """
+    Load a CSV file, skipping rows with more columns than the header.
+    Rows with fewer columns are kept, with the missing fields set to NaN.
+    :param file_path: Path to the CSV file.
+    :return: DataFrame with the columns of the CSV header.
+    """
+    df = pd.read_csv(file_path, on_bad_lines="skip", memory_map=True, engine="c")
+    # Keep the text columns in Arrow string arrays
+    text_columns = df.select_dtypes(include=["object", "string"]).columns
+    return df.astype(dict.fromkeys(text_columns, STRING_DTYPE))
+
+
+# Cleaning function for each DataFrame name
+CLEANERS = {
+    "hitters": clean_hitters,
+    "pitchers": clean_pitchers,
+    "team_standings": clean_team_standings,
+    "hitter_leaderboard": clean_leaderboard,
+    "pitcher_leaderboard": clean_leaderboard,
+}
+
+# Clean the DataFrames in parallel only when there are enough rows to pay for starting the workers
+PARALLEL_MIN_ROWS = 200_000
+
+
+def clean_dataframe(name, df):
+    """
+    Clean a DataFrame with the cleaning function for its name.
+    :param name: Name of the DataFrame.
+    :param df: DataFrame to clean.
+    :return: Cleaned DataFrame, or the DataFrame as is if no specific cleaning function exists.
+    """
+    cleaner = CLEANERS.get(name)
+    return cleaner(df) if cleaner else df
 
 
 def process_dataframes(dataframes):
     """
     Process and clean multiple DataFrames efficiently.
+    The tables don't depend on each other, so large ones are cleaned in parallel worker processes.
     :param dataframes: Dictionary where keys are DataFrame names and values are DataFrames.
     :return: Dictionary of cleaned DataFrames.
     """
     cleaned_dataframes = {}
+    remaining = dict(dataframes)
+
+    # Workers are forked: spawned workers would re-run the importing script (e.g. the dashboard's
+    # top-level code and its cache build), so without fork the tables are cleaned in this process
+    total_rows = sum(len(df) for df in dataframes.values())
+    if (
+        total_rows >= PARALLEL_MIN_ROWS
+        and "fork" in multiprocessing.get_all_start_methods()
+        and multiprocessing.parent_process() is None
+    ):
+        try:
+            with ProcessPoolExecutor(
+                max_workers=len(dataframes),
+                mp_context=multiprocessing.get_context("fork"),
+            ) as executor:
+                futures = {
+                    name: executor.submit(clean_dataframe, name, df)
+                    for name, df in dataframes.items()
+                }
+                for name, future in futures.items():
+                    try:
+                        cleaned_dataframes[name] = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        print(f"Error processing DataFrame '{name}': {e}")
+                    del remaining[name]
+        except Exception as e:
+            # Fall back to cleaning the remaining DataFrames in this process
+            print("Error cleaning DataFrames in parallel:", e)
 
-    for name, df in dataframes.items():
+    for name, df in remaining.items():
         try:
-            if name == "team_standings":
-                # Clean the team standings DataFrame
-                cleaned_dataframes[name] = clean_team_standings(df)
-            elif name in ["hitters", "pitchers"]:
-                # Clean hitters and pitchers DataFrames
-                cleaned_dataframes[name] = (
-                    clean_hitters(df) if name == "hitters" else clean_pitchers(df)
-                )
-            elif name in ["hitter_leaderboard", "pitcher_leaderboard"]:
-                # Clean leaderboard DataFrames
-                cleaned_dataframes[name] = clean_leaderboard(df)
-            else:
-                # If no specific cleaning function exists, keep the DataFrame as is
-                cleaned_dataframes[name] = df
+            cleaned_dataframes[name] = clean_dataframe(name, df)
         except Exception as e:
             print(f"Error processing DataFrame '{name}': {e}")
 
-    return cleaned_dataframes
+    # Keep the order of the input dictionary
+    return {
+        name: cleaned_dataframes[name]
+        for name in dataframes
+        if name in cleaned_dataframes
+    }
 
 
 def load_and_process_dataframes():
@@ -219,23 +312,25 @@ def load_and_process_dataframes():
         "games_behind",
     ]
     leaderboard_columns = ["id", "year", "statistic", "team", "value"]
+    # Columns the CSV parser can convert directly; the others can hold shifted or malformed values
+    id_year_types = {"id": "int64", "year": "int64"}
 
     # Load the CSV files into DataFrames
     try:
-        hitters_df = pd.read_csv(CSV_FILES["hitters"], on_bad_lines="skip")
+        hitters_df = read_csv_skipping_bad_lines(CSV_FILES["hitters"])
     except Exception as e:
         print("Error loading hitters CSV:", e)
         hitters_df = pd.DataFrame()
 
     try:
-        pitchers_df = pd.read_csv(CSV_FILES["pitchers"], on_bad_lines="skip")
+        pitchers_df = read_csv_skipping_bad_lines(CSV_FILES["pitchers"])
     except Exception as e:
         print("Error loading pitchers CSV:", e)
         pitchers_df = pd.DataFrame()
 
     try:
         team_standings_df = load_csv_with_fallback(
-            CSV_FILES["team_standings"], team_standings_columns
+            CSV_FILES["team_standings"], team_standings_columns, id_year_types
         )
     except Exception as e:
         print("Error loading team standings CSV:", e)
@@ -243,7 +338,7 @@ def load_and_process_dataframes():
 
     try:
         hitter_leaderboard_df = load_csv_with_fallback(
-            CSV_FILES["hitter_leaderboard"], leaderboard_columns
+            CSV_FILES["hitter_leaderboard"], leaderboard_columns, id_year_types
         )
     except Exception as e:
         print("Error loading hitter leaderboard CSV:", e)
@@ -251,7 +346,7 @@ def load_and_process_dataframes():
 
     try:
         pitcher_leaderboard_df = load_csv_with_fallback(
-            CSV_FILES["pitcher_leaderboard"], leaderboard_columns
+            CSV_FILES["pitcher_leaderboard"], leaderboard_columns, id_year_types
         )
     except Exception as e:
         print("Error loading pitcher leaderboard CSV:", e)
@@ -272,6 +367,61 @@ def load_and_process_dataframes():
     return cleaned_dataframes
 
 
+def cache_path(name):
+    """Return the path of the cached Feather file for a DataFrame."""
+    return os.path.join(CACHE_DIR, f"{name}.feather")
+
+
+def cache_fresh():
+    """
+    Check whether the Feather cache can be used.
+    :return: True if every cached file exists and is newer than its CSV file and this script.
+    """
+    for name, csv_file in CSV_FILES.items():
+        if not os.path.exists(cache_path(name)):
+            return False
+        cache_mtime = os.path.getmtime(cache_path(name))
+        for source in (csv_file, __file__):
+            if os.path.exists(source) and os.path.getmtime(source) > cache_mtime:
+                return False
+    return True
+
+
+def build_cache():
+    """
+    Load and clean the CSV files and write the cleaned DataFrames to the Feather cache.
+    :return: Dictionary of cleaned DataFrames.
+    """
+    cleaned_dataframes = load_and_process_dataframes()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    for name, df in cleaned_dataframes.items():
+        # Write to a file of this process and move it into place, so other processes
+        # (e.g. several dashboard workers starting at once) never read a partly written file
+        temp_path = f"{cache_path(name)}.{os.getpid()}.tmp"
+        try:
+            # Feather needs a default index; write uncompressed so it can be memory-mapped
+            df.reset_index(drop=True).to_feather(temp_path, compression="uncompressed")
+            os.replace(temp_path, cache_path(name))
+        except Exception as e:
+            print(f"Error caching DataFrame '{name}': {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    return cleaned_dataframes
+
+
+def load_cached_dataframes():
+    """
+    Load the cleaned DataFrames from the Feather cache by memory-mapping the files.
+    :return: Dictionary of cleaned DataFrames.
+    """
+    return {
+        name: feather.read_feather(cache_path(name), memory_map=True)
+        for name in CSV_FILES
+    }
+
+
 if __name__ == "__main__":
     # Load and process the DataFrames
     cleaned_dataframes = load_and_process_dataframes()
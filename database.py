@@ -1,5 +1,5 @@
+import csv
 import sqlite3
-import pandas as pd
 import os
 
 # File paths for the CSV files
@@ -13,6 +13,67 @@ CSV_FILES = {
 
 DB_FILE = "sports_data.db"
 
+# SQLite types of the columns of the cleaned CSV files; other columns are stored as TEXT
+COLUMN_TYPES = {
+    "id": "INTEGER",
+    "year": "INTEGER",
+    "value": "REAL",
+    "wins": "REAL",
+    "losses": "REAL",
+    "win_percentage": "REAL",
+    "games_behind": "REAL",
+    "statistic": "TEXT",
+    "name": "TEXT",
+    "team": "TEXT",
+    "team_roster": "TEXT",
+    "top_25": "TEXT",
+}
+
+# Indexes built after the bulk load, for the columns the tables are usually filtered on
+TABLE_INDEXES = {
+    "hitters": ["year", "team"],
+    "pitchers": ["year", "team"],
+    "team_standings": ["year"],
+    "hitter_leaderboard": ["year"],
+    "pitcher_leaderboard": ["year"],
+}
+
+# Number of rows fetched and printed at a time by the query prompt
+FETCH_BATCH_SIZE = 1000
+
+
+def import_csv_file(conn, table_name, file_path):
+    """
+    Stream the rows of a CSV file into a new SQLite table with one prepared INSERT statement.
+    The caller commits the transaction.
+    :param conn: Open SQLite connection.
+    :param table_name: Name of the table to create.
+    :param file_path: Path to the CSV file; its header row gives the column names, typed with COLUMN_TYPES.
+    """
+    with open(file_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        columns = next(reader)
+        column_defs = ", ".join(
+            f'"{column}" {COLUMN_TYPES.get(column, "TEXT")}' for column in columns
+        )
+        placeholders = ", ".join("?" * len(columns))
+
+        # A savepoint lets a failed file be undone without losing the other tables
+        conn.execute("SAVEPOINT import_csv_file")
+        try:
+            conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+            conn.execute(f'CREATE TABLE "{table_name}" ({column_defs})')
+            # Empty fields are missing values, stored as NULL
+            conn.executemany(
+                f'INSERT INTO "{table_name}" VALUES ({placeholders})',
+                ([value if value != "" else None for value in row] for row in reader),
+            )
+        except Exception:
+            conn.execute("ROLLBACK TO import_csv_file")
+            raise
+        finally:
+            conn.execute("RELEASE import_csv_file")
+
 
 def import_csv_to_sqlite(csv_files, db_file):
     """
@@ -24,21 +85,41 @@ def import_csv_to_sqlite(csv_files, db_file):
         conn = sqlite3.connect(db_file)
         print(f"Connected to SQLite database: {db_file}")
 
+        # The tables are rebuilt from the CSV files, so trade durability for load speed
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-200000")
+
+        # Import every file in one transaction, so the database is synced once
+        conn.execute("BEGIN")
+        imported_tables = []
         for table_name, file_path in csv_files.items():
             if not os.path.exists(file_path):
                 print(f"File not found: {file_path}")
                 continue
 
             try:
-                # Load the CSV into a DataFrame
-                df = pd.read_csv(file_path)
-
-                # Import the DataFrame into the SQLite database
-                df.to_sql(table_name, conn, if_exists="replace", index=False)
+                import_csv_file(conn, table_name, file_path)
+                imported_tables.append(table_name)
                 print(f"Imported {file_path} into table '{table_name}'")
             except Exception as e:
                 print(f"Error importing {file_path} into table '{table_name}': {e}")
 
+        # Index the tables once they are loaded, so the inserts don't update the indexes row by row
+        for table_name in imported_tables:
+            for column in TABLE_INDEXES.get(table_name, []):
+                try:
+                    conn.execute(
+                        f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_{column}" '
+                        f'ON "{table_name}" ("{column}")'
+                    )
+                except sqlite3.Error as e:
+                    print(
+                        f"Error indexing column '{column}' of table '{table_name}': {e}"
+                    )
+        conn.commit()
+
         conn.close()
         print("Database import completed.")
     except Exception as e:
@@ -65,13 +146,19 @@ def query_database(db_file):
 
             try:
                 # Execute the query
-                result = pd.read_sql_query(query, conn)
-
-                # Display the results
-                if result.empty:
+                cursor = conn.execute(query)
+
+                # Display the results a batch at a time instead of loading them all
+                row_count = 0
+                for batch in iter(lambda: cursor.fetchmany(FETCH_BATCH_SIZE), []):
+                    if row_count == 0:
+                        print("\t".join(column[0] for column in cursor.description))
+                    for row in batch:
+                        print("\t".join(map(str, row)))
+                    row_count += len(batch)
+
+                if row_count == 0:
                     print("Query executed successfully, but no results found.")
-                else:
-                    print(result)
             except Exception as e:
                 print(f"Error executing query: {e}")
 